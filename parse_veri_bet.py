@@ -8,15 +8,21 @@ Author: João Pedro de Souza Santos
 """
 
 # Standard Library Imports
-import json
+import asyncio
 import re
 import time
 import datetime
+import functools
 import logging
+import multiprocessing.util
 import os
+import queue
+import signal
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 
 # Third-Party Imports
 from selenium import webdriver
@@ -24,47 +30,119 @@ from selenium.webdriver.firefox.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 
+import httpx
+import orjson
 from dotenv import load_dotenv
+from lxml import html
+from lxml.cssselect import CSSSelector
+
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
+
+
+@dataclass(frozen=True)
+class Config:
+    """Runtime settings, parsed once from the environment."""
+    base_url: str
+    urls: Tuple[str, ...] = ()  # Pages scraped each iteration, defaults to (base_url,)
+    workers: int = 1  # Scraper processes, each with its own WebDriver session
+    scrape_interval: int = 10
+    max_retries: int = 3
+    driver_max_uses: int = 500  # Scrapes served before a session is recycled
+    http_fetch: bool = False  # Try a plain HTTP fetch before falling back to the browser
+
+    def __post_init__(self) -> None:
+        """Scrapes the base URL alone when no other pages are configured."""
+        if not self.urls:
+            object.__setattr__(self, "urls", (self.base_url,))
+
+    @classmethod
+    def from_env(cls) -> "Config":
+        """Loads .env and validates every setting, exiting on invalid values."""
+        load_dotenv()
+
+        base_url = os.getenv("BASE_URL")
+        if not base_url:
+            logging.error("❌ BASE_URL is not defined in .env")
+            sys.exit(1)
 
-# Load environment variables
-load_dotenv()
+        try:
+            max_retries = int(os.getenv("MAX_RETRIES", cls.max_retries))
+            if max_retries < 2:
+                logging.warning("⚠️ MAX_RETRIES is too low. Setting to 3 times.")
+                max_retries = 3
+        except ValueError:
+            logging.error("❌ MAX_RETRIES must be a valid integer in .env")
+            sys.exit(1)
+
+        try:
+            scrape_interval = int(os.getenv("SCRAPE_INTERVAL", cls.scrape_interval))
+            if scrape_interval < 5:
+                logging.warning("⚠️ SCRAPE_INTERVAL is too low. Setting to 10 seconds.")
+                scrape_interval = 10
+        except ValueError:
+            logging.error("❌ SCRAPE_INTERVAL must be a valid integer in .env")
+            sys.exit(1)
+
+        urls = tuple(url.strip() for url in os.getenv("SCRAPE_URLS", base_url).split(",") if url.strip())
+
+        try:
+            workers = max(int(os.getenv("WORKERS", len(urls))), 1)
+            driver_max_uses = max(int(os.getenv("DRIVER_MAX_USES", cls.driver_max_uses)), 1)
+        except ValueError:
+            logging.error("❌ WORKERS and DRIVER_MAX_USES must be valid integers in .env")
+            sys.exit(1)
+
+        http_fetch = os.getenv("HTTP_FETCH", "false").lower() in ("1", "true", "yes")
 
-# Logging Configuration
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+        return cls(base_url, urls, workers, scrape_interval, max_retries, driver_max_uses, http_fetch)
 
-# Constants
-BASE_URL = os.getenv("BASE_URL")
-SCRAPE_INTERVAL = os.getenv("SCRAPE_INTERVAL")
-MAX_RETRIES = os.getenv("MAX_RETRIES")
 
-if not BASE_URL:
-    logging.error("❌ BASE_URL is not defined in .env")
-    sys.exit(1)
+# Seconds between WebDriverWait checks; Selenium's 0.5 s default adds up to half a second per wait
+_POLL_FREQUENCY = 0.1
 
+# Page-level locators; per-row fields are read by _EXTRACT_ROWS_JS
+_ROW_SEL = (By.CSS_SELECTOR, ".row.justify-content-md-center .col.col-md")
+_DATE_SEL = (By.ID, "datepicker")
 
-try:
-    MAX_RETRIES = int(MAX_RETRIES)
-    if MAX_RETRIES < 2:
-        logging.warning("⚠️ MAX_RETRIES is too low. Setting to 3 times.")
-        MAX_RETRIES = 3
-except (ValueError, TypeError):
-    logging.error("❌ MAX_RETRIES must be a valid integer in .env")
-    sys.exit(1)
+# Precompiled patterns used in the row parsing hot path
+_SPREAD_RE = re.compile(r"([-+]?\d+(?:\.\d+)?)")
+_PRICE_RE = re.compile(r"\(([-+]?\d+)\)")
 
+# Options for the stdout dump; orjson serializes dataclasses natively, without a dict per item
+_JSON_OPTIONS = orjson.OPT_INDENT_2
 
-try:
-    SCRAPE_INTERVAL = int(SCRAPE_INTERVAL)
-    if SCRAPE_INTERVAL < 5:
-        logging.warning("⚠️ SCRAPE_INTERVAL is too low. Setting to 10 seconds.")
-        SCRAPE_INTERVAL = 10
-except (ValueError, TypeError):
-    logging.error("❌ SCRAPE_INTERVAL must be a valid integer in .env")
-    sys.exit(1)
+# Reads every field the row parser needs from all game rows in a single WebDriver call
+_EXTRACT_ROWS_JS = """
+return arguments[0].map(r => ({
+    teams: [...r.querySelectorAll('a.text-muted')].map(a => a.innerText),
+    ml: [...r.querySelectorAll('td:nth-child(2) span.text-muted')].map(s => s.innerText),
+    sp: [...r.querySelectorAll('td:nth-child(3) span.text-muted')].map(s => s.innerText),
+    tot: [...r.querySelectorAll('td:nth-child(4) span.text-muted')].map(s => s.innerText),
+    sport: (r.querySelector("a[href*='betting-trends?f=']") || {}).href || null,
+    period: (r.querySelector('span.badge.badge-light') || {}).innerText || null,
+}));
+"""
+
+# Same row fields as _EXTRACT_ROWS_JS, for pages fetched over plain HTTP
+_ROW_CSS = CSSSelector(_ROW_SEL[1])
+_TEAM_CSS = CSSSelector("a.text-muted")
+_ML_CSS = CSSSelector("td:nth-child(2) span.text-muted")
+_SP_CSS = CSSSelector("td:nth-child(3) span.text-muted")
+_TOT_CSS = CSSSelector("td:nth-child(4) span.text-muted")
+_SPORT_CSS = CSSSelector("a[href*='betting-trends?f=']")
+_PERIOD_CSS = CSSSelector("span.badge.badge-light")
+_DATE_CSS = CSSSelector("input#datepicker")
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_sport(href: str) -> str:
+    """Extracts the sport/league code from a betting-trends link, cached per distinct link."""
+    return href.rsplit("f=", 1)[-1].upper()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Item:
     """Represents a single betting line entry."""
     sport_league: str
@@ -80,13 +158,99 @@ class Item:
     pitcher: str = ""
 
 
+class BrowserPool:
+    """Keeps a fixed number of warm WebDriver sessions and recycles them after repeated use."""
+
+    def __init__(self, factory: Callable[[], webdriver.Firefox], size: int = 1, max_uses: int = 500) -> None:
+        """Starts `size` sessions up front so no scrape pays the browser cold start."""
+        self.factory = factory
+        self.max_uses = max_uses
+        self.drivers: "queue.Queue[webdriver.Firefox]" = queue.Queue(maxsize=size)
+        self.uses: Dict[webdriver.Firefox, int] = {}
+        for _ in range(size):
+            self._add_driver()
+
+    def _add_driver(self) -> None:
+        """Creates a fresh session and makes it available to the pool."""
+        driver = self.factory()
+        self.uses[driver] = 0
+        self.drivers.put(driver)
+
+    def _recycle(self, driver: webdriver.Firefox) -> None:
+        """Quits a session and replaces it with a fresh one."""
+        self.uses.pop(driver, None)
+        try:
+            driver.quit()
+        except Exception as e:
+            logging.warning(f"⚠️ Failed to quit WebDriver cleanly: {e}")
+        self._add_driver()
+
+    @contextmanager
+    def acquire(self, timeout: float = 60) -> Iterator[webdriver.Firefox]:
+        """Borrows a session, returning it to the pool (or recycling it) afterwards."""
+        try:
+            driver = self.drivers.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No WebDriver became available within {timeout} seconds") from None
+
+        failed = True
+        try:
+            yield driver
+            failed = False
+        finally:
+            # Also covers BaseExceptions such as asyncio.CancelledError, so a session never leaks out of the pool
+            if failed:
+                # The session may be in an unknown state, so don't hand it out again
+                self._recycle(driver)
+            else:
+                self.uses[driver] += 1
+                if self.uses[driver] >= self.max_uses:
+                    logging.info(f"♻️ Recycling WebDriver after {self.uses[driver]} uses.")
+                    self._recycle(driver)
+                else:
+                    self.drivers.put(driver)
+
+    def close(self) -> None:
+        """Quits every session currently held by the pool."""
+        while not self.drivers.empty():
+            driver = self.drivers.get_nowait()
+            self.uses.pop(driver, None)
+            driver.quit()
+
+
 class SportsScraper:
     """A scraper class to extract sports betting data from veri.bet."""
 
-    def __init__(self) -> None:
-        """Initializes the WebDriver in headless mode, with retry logic."""
-        self.driver = self.setup_driver()
-        self.cached_event_date = None  # Cache the event date
+    def __init__(self, config: Config) -> None:
+        """Prepares the scraper; the WebDriver pool is started on first use."""
+        self.config = config
+        self._pool: Optional[BrowserPool] = None
+        # A worker runs one scrape at a time, so a single thread serves its blocking calls
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self._http_client: Optional[httpx.Client] = None
+        self.event_dates: Dict[str, str] = {}  # Cached event date per page URL
+
+    @property
+    def pool(self) -> BrowserPool:
+        """The worker's headless WebDriver session, started lazily so HTTP-only runs never launch Firefox."""
+        if self._pool is None:
+            self._pool = BrowserPool(self.setup_driver, max_uses=self.config.driver_max_uses)
+        return self._pool
+
+    @property
+    def http_client(self) -> httpx.Client:
+        """The HTTP client, kept for the scraper's lifetime so connections are reused across scrapes."""
+        if self._http_client is None:
+            self._http_client = httpx.Client(follow_redirects=True, timeout=10)
+        return self._http_client
+
+    def close(self) -> None:
+        """Shuts down the page loading workers, the HTTP client and every pooled WebDriver."""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        if self._http_client is not None:
+            self._http_client.close()
+        if self._pool is not None:
+            self._pool.close()
 
     def setup_driver(self) -> Optional[webdriver.Firefox]:
         """Sets up the Selenium WebDriver to run headless, with retry logic."""
@@ -96,13 +260,14 @@ class SportsScraper:
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
 
-        for attempt in range(MAX_RETRIES):
+        max_retries = self.config.max_retries
+        for attempt in range(max_retries):
             try:
                 driver = webdriver.Firefox(options=options)
                 logging.info("✅ WebDriver initialized in headless mode.")
                 return driver
             except Exception as e:
-                logging.error(f"❌ Failed to initialize WebDriver (Attempt {attempt + 1}/{MAX_RETRIES}): {e}")
+                logging.error(f"❌ Failed to initialize WebDriver (Attempt {attempt + 1}/{max_retries}): {e}")
                 time.sleep(10)
 
         logging.error("❌ All WebDriver initialization attempts failed. Exiting.")
@@ -112,7 +277,7 @@ class SportsScraper:
     def extract_spread(value_str: str) -> float:
         """Extracts the spread value from text, ensuring the format is correctly recognized."""
         try:
-            match = re.search(r"([-+]?\d+(\.\d+)?)", value_str)
+            match = _SPREAD_RE.search(value_str)
             return float(match.group(1)) if match else 0.0
         except (ValueError, AttributeError):
             return 0.0
@@ -120,142 +285,248 @@ class SportsScraper:
     @staticmethod
     def extract_price(value_str: str) -> str:
         """Extracts the odds price from the given text."""
-        match = re.search(r"\(([-+]?\d+)\)", value_str)
+        match = _PRICE_RE.search(value_str)
         return match.group(1) if match else value_str.strip()
 
-    def get_event_date(self) -> str:
-        """Retrieves the event date once and caches it for efficiency."""
-        if self.cached_event_date:
-            return self.cached_event_date
+    def get_event_date(self, driver: webdriver.Firefox, url: str) -> str:
+        """Retrieves the event date once per page URL and caches it for efficiency."""
+        if url in self.event_dates:
+            return self.event_dates[url]
 
         try:
-            date_input = WebDriverWait(self.driver, 20).until(
-                EC.visibility_of_element_located((By.ID, "datepicker"))
+            date_input = WebDriverWait(driver, 20, poll_frequency=_POLL_FREQUENCY).until(
+                EC.visibility_of_element_located(_DATE_SEL)
             )
-            raw_date = date_input.get_attribute("value")
+            return self._resolve_event_date(url, date_input.get_property("value"))
 
-            if not raw_date:
-                logging.warning("⚠️ Date field is empty, using the current date.")
-                self.cached_event_date = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S+00:00")
-                return self.cached_event_date
+        except TimeoutException:
+            logging.warning("⚠️ Failed to retrieve event date, using current date.")
+            self.event_dates[url] = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "+00:00"
+            return self.event_dates[url]
+
+    def _resolve_event_date(self, url: str, raw_date: Optional[str]) -> str:
+        """Converts the date picker value into the UTC event date cached for the page."""
+        if not raw_date:
+            logging.warning("⚠️ Date field is empty, using the current date.")
+            self.event_dates[url] = datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "+00:00"
+            return self.event_dates[url]
+
+        current_time = datetime.datetime.now().strftime("%H:%M:%S")
+        raw_datetime = f"{raw_date} {current_time}"
+
+        parsed_date = datetime.datetime.strptime(raw_datetime, "%m-%d-%Y %H:%M:%S")
+        self.event_dates[url] = parsed_date.isoformat() + "+00:00"
+        return self.event_dates[url]
+
+    async def scrape(self, url: str) -> List[Item]:
+        """Scrapes the page over plain HTTP when enabled, falling back to the browser."""
+        if self.config.http_fetch:
+            try:
+                items = await self.parse_game_data_http(url)
+                if items:
+                    return items
+                logging.info("ℹ️ No betting lines in the HTTP response, falling back to WebDriver.")
+            except Exception as e:
+                # Any failure here (request, HTML parsing, unexpected date format) leaves the browser to try
+                logging.warning(f"⚠️ HTTP fetch failed, falling back to WebDriver: {e!r}")
 
-            current_time = datetime.datetime.now().strftime("%H:%M:%S")
-            raw_datetime = f"{raw_date} {current_time}"
+        return await self.parse_game_data(url)
 
-            parsed_date = datetime.datetime.strptime(raw_datetime, "%m-%d-%Y %H:%M:%S")
-            self.cached_event_date = parsed_date.strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            return self.cached_event_date
+    async def parse_game_data_http(self, url: str) -> List[Item]:
+        """Fetches the page without a browser and parses its betting lines."""
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(self.executor, self.http_client.get, url)
+        response.raise_for_status()
 
-        except TimeoutException:
-            logging.warning("⚠️ Failed to retrieve event date, using current date.")
-            self.cached_event_date = datetime.datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%S+00:00")
-            return self.cached_event_date
+        event_date_utc, game_rows = self._extract_rows_html(url, response.text)
+        items = []
+        for row in game_rows:
+            items.extend(self._parse_row(row, event_date_utc))
+        return items
+
+    def _extract_rows_html(self, url: str, page: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """Reads the event date and the raw fields of every game row from server-rendered HTML."""
+        document = html.fromstring(page)
+        game_rows = []
+        for row in _ROW_CSS(document):
+            sport = _SPORT_CSS(row)
+            period = _PERIOD_CSS(row)
+            game_rows.append({
+                "teams": [self._inner_text(a) for a in _TEAM_CSS(row)],
+                "ml": [self._inner_text(span) for span in _ML_CSS(row)],
+                "sp": [self._inner_text(span) for span in _SP_CSS(row)],
+                "tot": [self._inner_text(span) for span in _TOT_CSS(row)],
+                "sport": sport[0].get("href") if sport else None,
+                "period": self._inner_text(period[0]) if period else None,
+            })
+
+        # Only trust the date picker when the grid was server-rendered, so a JS-only
+        # page doesn't cache a fallback date ahead of the WebDriver path
+        event_date_utc = self.event_dates.get(url, "")
+        if game_rows and not event_date_utc:
+            date_inputs = _DATE_CSS(document)
+            event_date_utc = self._resolve_event_date(url, date_inputs[0].get("value") if date_inputs else None)
+        return event_date_utc, game_rows
+
+    @staticmethod
+    def _inner_text(element: html.HtmlElement) -> str:
+        """Approximates the browser's innerText: one line per non-blank text node."""
+        return "\n".join(text.strip() for text in element.itertext() if text.strip())
+
+    async def parse_game_data(self, url: str) -> List[Item]:
+        """Loads the page in a pooled WebDriver and parses its betting lines."""
+        loop = asyncio.get_running_loop()
+        with self.pool.acquire() as driver:
+            event_date_utc, game_rows = await loop.run_in_executor(self.executor, self._load_page, driver, url)
 
-    def parse_game_data(self) -> List[Item]:
-        """Parses betting lines from the page."""
         items = []
+        for row in game_rows:
+            items.extend(self._parse_row(row, event_date_utc))
+        return items
+
+    def _load_page(self, driver: webdriver.Firefox, url: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """Navigates to the page and reads the raw fields of every game row."""
+        driver.get(url)
+        event_date_utc = self.get_event_date(driver, url)
         try:
-            event_date_utc = self.get_event_date()
-            game_rows = WebDriverWait(self.driver, 10).until(
-                EC.visibility_of_all_elements_located((By.CSS_SELECTOR, ".row.justify-content-md-center .col.col-md"))
+            # Presence rather than visibility: the latter runs Selenium's isDisplayed probe once per row
+            game_rows = WebDriverWait(driver, 10, poll_frequency=_POLL_FREQUENCY).until(
+                EC.presence_of_all_elements_located(_ROW_SEL)
             )
-
-            for row in game_rows:
-                try:
-                    team_names = row.find_elements(By.CSS_SELECTOR, "a.text-muted")
-                    moneyline_prices = row.find_elements(By.CSS_SELECTOR, "td:nth-child(2) span.text-muted")
-                    spread_prices = row.find_elements(By.CSS_SELECTOR, "td:nth-child(3) span.text-muted")
-                    total_prices = row.find_elements(By.CSS_SELECTOR, "td:nth-child(4) span.text-muted")
-
-                    sport_league = "UNKNOWN"
-                    try:
-                        sport_elem = row.find_element(By.CSS_SELECTOR, "a[href*='betting-trends?f=']")
-                        sport_league = sport_elem.get_attribute("href").split("f=")[-1].upper()
-                    except NoSuchElementException:
-                        pass
-
-                    period = "FULL GAME"
-                    try:
-                        # period_elem = row.find_element(By.CSS_SELECTOR, "span.badge.badge-light")
-                        period_elem = row.find_element(By.XPATH, ".//span[contains(@class, 'badge') and contains(@class, 'badge-light')]")
-                        period_elem = self.driver.find_element(By.XPATH, ".//span[contains(@class, 'badge') and contains(@class, 'badge-light') and contains(text(), 'FINAL')]")
-                        print(period_elem.get_attribute("outerHTML"))
-                        period = period_elem.text.strip()
-                    except NoSuchElementException:
-                        pass
-
-                    if len(team_names) < 2 or len(moneyline_prices) < 2:
-                        logging.warning("⚠️ Missing data in row. Skipping...")
-                        continue
-
-                    team1, team2 = team_names[0].text, team_names[1].text
-
-                    # Moneyline bets
-                    if len(moneyline_prices) >= 2:
-                        items.append(Item(sport_league, event_date_utc, team1, team2, period, "moneyline",
-                                        self.extract_price(moneyline_prices[1].text), team1, team1,
-                                        self.extract_spread(spread_prices[1].text)))
-                        items.append(Item(sport_league, event_date_utc, team1, team2, period, "moneyline",
-                                        self.extract_price(moneyline_prices[2].text), team2, team2,
-                                        self.extract_spread(spread_prices[2].text)))
-
-                    # Draw bet (only for Soccer)
-                    if "SOCCER" in sport_league and len(moneyline_prices) >= 4:
-                        draw_price = moneyline_prices[3].text.replace("DRAW\n", "").strip()
-                        items.append(Item(sport_league, event_date_utc, team1, team2, period, "moneyline",
-                                          draw_price, "draw", "draw"))
-
-                    # Spread bets
-                    if len(spread_prices) >= 2:
-                        items.append(Item(sport_league, event_date_utc, team1, team2, period, "spread",
-                                          self.extract_price(spread_prices[1].text), team1, team1,
-                                          self.extract_spread(spread_prices[1].text)))
-                        items.append(Item(sport_league, event_date_utc, team1, team2, period, "spread",
-                                          self.extract_price(spread_prices[2].text), team2, team2,
-                                          self.extract_spread(spread_prices[2].text)))
-
-                    # Over/Under bets
-                    if len(total_prices) >= 2:
-                        items.append(Item(sport_league, event_date_utc, team1, team2, period, "over/under",
-                                          self.extract_price(total_prices[1].text), "over", "total",
-                                          self.extract_spread(spread_prices[1].text)))
-                        items.append(Item(sport_league, event_date_utc, team1, team2, period, "over/under",
-                                          self.extract_price(total_prices[2].text), "under", "total",
-                                          self.extract_spread(spread_prices[2].text)))
-
-
-
-                except Exception as e:
-                    logging.warning(f"⚠️ Error parsing row: {e}")
-                    continue
-
         except TimeoutException:
             logging.warning("⚠️ Timeout while loading the page.")
+            return event_date_utc, []
+        return event_date_utc, driver.execute_script(_EXTRACT_ROWS_JS, game_rows)
+
+    def _parse_row(self, row: Dict[str, Any], event_date_utc: str) -> List[Item]:
+        """Parses the betting lines of a single game row."""
+        # Guarded so the row isn't formatted at all unless debug logging is on
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"🔍 Raw row fields: {row}")
+
+        items = []
+        try:
+            team_names = row["teams"]
+            moneyline_prices = row["ml"]
+            spread_prices = row["sp"]
+            total_prices = row["tot"]
+
+            sport_league = "UNKNOWN"
+            if row["sport"]:
+                sport_league = _parse_sport(row["sport"])
+
+            period = "FULL GAME"
+            if row["period"]:
+                period = row["period"].strip()
+
+            if len(team_names) < 2 or len(moneyline_prices) < 2:
+                logging.warning("⚠️ Missing data in row. Skipping...")
+                return items
+
+            team1, team2 = team_names[0], team_names[1]
+
+            # Every line in the row shares the same game fields
+            make_item = functools.partial(Item, sport_league, event_date_utc, team1, team2, period)
+
+            # Moneyline bets
+            if len(moneyline_prices) >= 2:
+                items.append(make_item("moneyline", self.extract_price(moneyline_prices[1]), team1, team1,
+                                       self.extract_spread(spread_prices[1])))
+                items.append(make_item("moneyline", self.extract_price(moneyline_prices[2]), team2, team2,
+                                       self.extract_spread(spread_prices[2])))
+
+            # Draw bet (only for Soccer)
+            if "SOCCER" in sport_league and len(moneyline_prices) >= 4:
+                draw_price = moneyline_prices[3].removeprefix("DRAW\n").strip()
+                items.append(make_item("moneyline", draw_price, "draw", "draw"))
+
+            # Spread bets
+            if len(spread_prices) >= 2:
+                items.append(make_item("spread", self.extract_price(spread_prices[1]), team1, team1,
+                                       self.extract_spread(spread_prices[1])))
+                items.append(make_item("spread", self.extract_price(spread_prices[2]), team2, team2,
+                                       self.extract_spread(spread_prices[2])))
+
+            # Over/Under bets
+            if len(total_prices) >= 2:
+                items.append(make_item("over/under", self.extract_price(total_prices[1]), "over", "total",
+                                       self.extract_spread(spread_prices[1])))
+                items.append(make_item("over/under", self.extract_price(total_prices[2]), "under", "total",
+                                       self.extract_spread(spread_prices[2])))
+
+        except Exception as e:
+            logging.warning(f"⚠️ Error parsing row: {e}")
 
         return items
 
 
-def save_data_to_json(items: List[Item], filename="betting_data.json"):
-    """Saves the extracted betting data to a JSON file."""
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump([item.__dict__ for item in items], f, indent=2, ensure_ascii=False)
+def save_data_to_json(items: List[Item], filename="betting_data.jsonl"):
+    """Appends the extracted betting data to a JSON Lines file, one item per line."""
+    with open(filename, "ab") as f:
+        f.writelines(orjson.dumps(item) + b"\n" for item in items)
     logging.info(f"📂 Data saved to {filename}")
 
 
-if __name__ == "__main__":
-    scraper = SportsScraper()
+# Long-lived scraper owned by each worker process, built by _init_worker
+_worker_scraper: Optional[SportsScraper] = None
+
+
+def _init_worker(config: Config) -> None:
+    """Builds the worker's scraper once; the parent process handles Ctrl+C and shuts the pool down."""
+    global _worker_scraper
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+    _worker_scraper = SportsScraper(config)
+    # Quit the worker's WebDrivers when the process pool shuts it down
+    multiprocessing.util.Finalize(_worker_scraper, _worker_scraper.close, exitpriority=10)
+
+
+def scrape_once(url: str) -> List[Item]:
+    """Scrapes a single page with the worker's scraper."""
     try:
-        while True:
-            scraper.driver.get(BASE_URL)
-            items = scraper.parse_game_data()
+        return asyncio.run(_worker_scraper.scrape(url))
+    except Exception as e:
+        logging.error(f"❌ Failed to scrape {url}: {e}")
+        return []
+
 
-            # Save the data to a JSON file
-            save_data_to_json(items) 
+async def main(config: Config) -> None:
+    """Scrapes every page on a fixed schedule; an iteration that overruns the interval starts the next one immediately."""
+    loop = asyncio.get_running_loop()
+    save_task: Optional[asyncio.Task] = None
+    next_tick = loop.time()
 
-            print(json.dumps([item.__dict__ for item in items], indent=2, ensure_ascii=False))
+    with ProcessPoolExecutor(max_workers=config.workers, initializer=_init_worker, initargs=(config,)) as pool:
+        while True:
+            next_tick += config.scrape_interval
+            items = []
+            for future in asyncio.as_completed([loop.run_in_executor(pool, scrape_once, url) for url in config.urls]):
+                items.extend(await future)
+
+            # Append the data to the JSON Lines file in the background, one write at a time
+            if save_task:
+                await save_task
+            save_task = asyncio.create_task(asyncio.to_thread(save_data_to_json, items))
+
+            sys.stdout.buffer.write(orjson.dumps(items, option=_JSON_OPTIONS) + b"\n")
+            sys.stdout.buffer.flush()
             logging.info(f"✅ Successfully scraped {len(items)} betting lines.")
-            time.sleep(SCRAPE_INTERVAL)
+
+            delay = next_tick - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            else:
+                # Rebase the schedule instead of bursting to catch up on missed ticks
+                next_tick = loop.time()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+
+    config = Config.from_env()
+    try:
+        asyncio.run(main(config))
     except KeyboardInterrupt:
-        logging.info("🛑 Script interrupted. Closing WebDriver...")
-        scraper.driver.quit()
-        sys.exit(0)
\ No newline at end of file
+        logging.info("🛑 Script interrupted. WebDrivers closed.")
+        sys.exit(0)